@@ -0,0 +1,23 @@
+import datetime as dt
+
+import pytest
+
+from xsettings.default_converters import to_date
+
+
+@pytest.mark.parametrize(
+    argnames="value,expected",
+    argvalues=[
+        ("2023-03-04", dt.date(2023, 3, 4)),
+        ("2023-3-4", dt.date(2023, 3, 4)),
+        ("2023-03-4", dt.date(2023, 3, 4)),
+    ],
+)
+def test_to_date(value, expected):
+    assert to_date(value) == expected
+
+
+@pytest.mark.parametrize(argnames="value", argvalues=["2023-W09-6", "20230304", "2023-13-04"])
+def test_to_date_only_accepts_year_month_day(value):
+    with pytest.raises(ValueError):
+        to_date(value)
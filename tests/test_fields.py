@@ -2,7 +2,7 @@ from typing import Any, Optional, Sequence
 
 import pytest as pytest
 
-from xsettings.fields import SettingsField, generate_setting_fields
+from xsettings.fields import SettingsField, SettingsConversionError, generate_setting_fields
 from xsettings.retreivers import SettingsRetrieverProtocol
 from xsettings import BaseSettings
 
@@ -189,3 +189,27 @@ def test_with_generic_typehint():
 
     assert SomeSettings.grab().generic_settings_field == ['a', '1', '!']
     assert type(SomeSettings.grab().generic_settings_field) is list
+
+
+def test_default_converter_follows_type_hint_changes():
+    field = SettingsField(name="val", type_hint=int, required=True)
+    assert field.convert_value("3") == 3
+
+    # Default converter is remembered per type-hint, changing hint should use the new one.
+    field.type_hint = float
+    value = field.convert_value("3")
+    assert value == 3.0
+    assert type(value) is float
+
+
+def test_generic_type_hint_checked_via_origin():
+    field = SettingsField(name="val", type_hint=Sequence[str], required=True)
+
+    value = ['a', 'b']
+    assert field.convert_value(value) is value
+    with pytest.raises(SettingsConversionError, match="generic type"):
+        field.convert_value(5)
+
+    # Base type-hint is remembered per type-hint, changing hint should use the new one.
+    field.type_hint = int
+    assert field.convert_value("3") == 3
@@ -163,6 +163,27 @@ def test_field_in_class_reuse():
     assert MyClass().my_var == 1
 
 
+def test_class_field_forward_ref_reused():
+    class MySettings(BaseSettings):
+        a: int = 1
+
+    class MySubSettings(MySettings):
+        pass
+
+    assert MySettings.a is MySettings.a
+
+    # Subclass forward-refs need to grab the subclass's settings object.
+    assert MySubSettings.a is not MySettings.a
+    MySubSettings.grab().a = 2
+
+    class MyClass:
+        my_var = MySettings.a
+        my_sub_var = MySubSettings.a
+
+    assert MyClass.my_var == 1
+    assert MyClass.my_sub_var == 2
+
+
 def test_field_overwriting():
     class MySettings(BaseSettings):
         a: str
@@ -194,6 +215,23 @@ def test_field_overwriting():
     assert my_settings.a == "6"
 
 
+def test_env_var_retriever_tries_upper_case_name(monkeypatch):
+    class MyEnvSettings(EnvVarSettings):
+        my_lower: str
+        MY_UPPER: str = 'default-upper'
+
+    monkeypatch.delenv('my_lower', raising=False)
+    monkeypatch.delenv('MY_UPPER', raising=False)
+    monkeypatch.setenv('MY_LOWER', 'lower-via-upper')
+
+    my_settings = MyEnvSettings.grab()
+    assert my_settings.my_lower == 'lower-via-upper'
+    assert my_settings.MY_UPPER == 'default-upper'
+
+    monkeypatch.setenv('MY_UPPER', 'upper')
+    assert my_settings.MY_UPPER == 'upper'
+
+
 def test_field_overwriting_classlevel():
     os.environ.pop("b", None)
 
@@ -386,6 +424,16 @@ def test_settings_inheritance_without_fields_allowed():
     assert MySettings._private_property == 6
 
 
+def test_setting_fields_are_read_only():
+    class MySettings(BaseSettings):
+        a: int
+
+    with pytest.raises(TypeError):
+        MySettings._setting_fields['b'] = SettingsField(name='b')
+
+    assert list(MySettings._setting_fields) == ['a']
+
+
 def test_source_class():
     class MySettings(BaseSettings):
         a: int
@@ -613,3 +661,20 @@ def test_grab_setting_values_from_parent_dependency_instances():
     assert my_settings.a == 'override-a'
     assert my_settings.b == 'str-val-r2'
     assert my_settings.c == 2
+
+
+def test_settings_proxy_dependency_type():
+    class MySettings(BaseSettings):
+        my_str: str = 'default'
+
+    my_settings = MySettings.proxy()
+
+    # `_SettingsProxy` relies on xinject's `CurrentDependencyProxy` storing this attribute.
+    assert object.__getattribute__(my_settings, '_dependency_type') is MySettings
+
+    assert my_settings.my_str == 'default'
+    with MySettings():
+        my_settings.my_str = 'changed'
+        assert my_settings.my_str == 'changed'
+        assert MySettings.grab().my_str == 'changed'
+    assert my_settings.my_str == 'default'
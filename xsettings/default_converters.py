@@ -11,7 +11,17 @@ def to_bool(value):
 
 
 def to_date(value):
-    return dt.datetime.strptime(str(value), '%Y-%m-%d').date()
+    value = str(value)
+
+    # `date.fromisoformat` is much faster than `strptime`, and parses zero-padded `YYYY-MM-DD`
+    # exactly the same way; it also accepts other ISO formats, so only use it for that shape.
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        try:
+            return dt.date.fromisoformat(value)
+        except ValueError:
+            pass
+
+    return dt.datetime.strptime(value, '%Y-%m-%d').date()
 
 
 def to_datetime(value):
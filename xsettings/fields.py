@@ -1,7 +1,9 @@
 import dataclasses
 from typing import Callable
 from copy import copy
-from typing import Type, Any, Dict, Generic, TypeVar, TYPE_CHECKING, get_type_hints
+from typing import (
+    Type, Any, Dict, Generic, Optional, Tuple, TypeVar, TYPE_CHECKING, get_type_hints
+)
 import typing_inspect
 
 from .default_converters import DEFAULT_CONVERTERS
@@ -28,6 +30,8 @@ class SettingsConversionError(ValueError, AttributeError):
 
 
 class SettingsClassProperty(Generic[T]):
+    __slots__ = ('fget',)
+
     def __init__(self, fget):
         self.fget = fget
 
@@ -49,6 +53,8 @@ class _PropertyRetriever:
     object/type the property is getting a value for; just like any other
     normal property would have happened when the value is asked for.
     """
+    __slots__ = ('property_retriever',)
+
     property_retriever: property
 
     def __init__(self, property_retriever: property):
@@ -58,7 +64,9 @@ class _PropertyRetriever:
         return self.property_retriever.__get__(settings, type(settings))
 
 
-@dataclasses.dataclass
+# Fields are allocated for every attribute on every BaseSettings subclass, and more are allocated
+# temporarily while merging them together; use `__slots__` to keep each one small.
+@dataclasses.dataclass(slots=True)
 class SettingsField:
     name: str = None
     """ Defaults to the attribute name, but you can override this to provide an alternate name
@@ -172,6 +180,28 @@ class SettingsField:
     use that for the default-value when needed.
     """
 
+    _default_converter_cache: Optional[Tuple[Any, Callable]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """
+    Internal: `(type_hint, converter)` remembered by `SettingsField._get_default_converter`,
+    so the type-hint is only inspected again if `SettingsField.type_hint` changes.
+
+    As it's a dataclass field (so it can have a slot), it's also included in
+    `dataclasses.fields(SettingsField)` and `dataclasses.asdict` results.
+    """
+
+    _base_typehint_cache: Optional[Tuple[Any, Any]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """
+    Internal: `(type_hint, base_typehint)` remembered by `SettingsField._get_base_typehint`,
+    so `typing` generics are only inspected again if `SettingsField.type_hint` changes.
+
+    As it's a dataclass field (so it can have a slot), it's also included in
+    `dataclasses.fields(SettingsField)` and `dataclasses.asdict` results.
+    """
+
     @property
     def getter(self):
         """
@@ -329,32 +359,47 @@ class SettingsField:
 
     def _get_default_converter(self) -> Callable:
         hint = self.type_hint
+        cache = self._default_converter_cache
+        if cache is not None and cache[0] is hint:
+            return cache[1]
+
         if isinstance(hint, typing_inspect.typingGenericAlias):
             # Only produce error if the type does not match and so system attempts to use
             # the default converter.
-            def generic_converter_error(x):
-                # todo: support looking at generic arg(s), converting any that need it and then
-                #   putting result into generic type; and if it's a generic Sequence,
-                #   use a List or Tuple, and so on...
-                raise SettingsConversionError(
-                    f"Unsupported: Can't convert value {x} into a generic type "
-                    f"(future feature)."
-                )
-            return generic_converter_error
-
-        # By default, convert using the type-hint;
-        # ie: If `int` was type-hint, then it could do `int(value)` to get an `int` out of `value`.
-        return hint
+            converter = _generic_converter_error
+        else:
+            # By default, convert using the type-hint; ie: If `int` was type-hint,
+            # then it could do `int(value)` to get an `int` out of `value`.
+            converter = hint
+
+        self._default_converter_cache = (hint, converter)
+        return converter
 
     def _get_base_typehint(self):
         hint = self.type_hint
+        cache = self._base_typehint_cache
+        if cache is not None and cache[0] is hint:
+            return cache[1]
+
         if not hint:
-            return None
+            base_hint = None
+        else:
+            base_hint = typing_inspect.get_origin(hint)
+            if base_hint is None:
+                base_hint = hint
+
+        self._base_typehint_cache = (hint, base_hint)
+        return base_hint
+
 
-        origin = typing_inspect.get_origin(hint)
-        if origin is None:
-            return hint
-        return origin
+def _generic_converter_error(x):
+    # todo: support looking at generic arg(s), converting any that need it and then
+    #   putting result into generic type; and if it's a generic Sequence,
+    #   use a List or Tuple, and so on...
+    raise SettingsConversionError(
+        f"Unsupported: Can't convert value {x} into a generic type "
+        f"(future feature)."
+    )
 
 
 def _allowed_field(k: str, v):
@@ -450,7 +495,6 @@ def generate_setting_fields(
 
     _add_field_default_from_attrs(fields, merge_field)
     _add_field_typehints_from_annotations(annotations, allowed_field_names, merge_field)
-    _unwrap_typehints(fields, merge_field)
     _add_field_overrides_from_attrs(fields, merge_field)
 
     for field in setting_fields.values():
@@ -529,7 +573,7 @@ def _add_field_default_from_attrs(class_attrs: Dict[str, Any], merge_field):
             if callable(getattr(v, 'fget', None)):
                 # Extract type-hint from the getter-functions return annotation;
                 # We will use it as a default/fallback type-hint.
-                prop_getter_return_type = get_type_hints(v.fget).get('return', None)
+                prop_getter_return_type = _get_return_type_hint(v.fget)
                 if prop_getter_return_type is not None:
                     field_values.type_hint = prop_getter_return_type
 
@@ -563,14 +607,14 @@ def _add_field_default_from_attrs(class_attrs: Dict[str, Any], merge_field):
         merge_field(k, field_values)
 
 
-def _unwrap_typehints(field_attrs: Dict[str, Any], merge_field):
-    """We take the public initial class attributes and their values and merge/create
-    fields from them.
-    """
-    for k, v in field_attrs.items():
-        field = v
-        if isinstance(v, SettingsField):
-            merge_field(k, field)
+def _get_return_type_hint(func) -> Any:
+    # Lots of getters here have no return annotation at all (ie: the `SettingsClassProperty`
+    # forward-references to other settings, or when type-hint is annotated elsewhere in class);
+    # `get_type_hints` evaluates every annotation on the function, so only use it when needed.
+    annotations = getattr(func, '__annotations__', None)
+    if not annotations or 'return' not in annotations:
+        return None
+    return get_type_hints(func).get('return', None)
 
 
 def _add_field_overrides_from_attrs(field_attrs: Dict[str, Any], merge_field):
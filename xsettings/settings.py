@@ -5,11 +5,13 @@ See doc-comments for `BaseSettings` below.
 
 """
 
+from types import MappingProxyType
 from typing import (
-    Dict, Any, Union, TypeVar, Protocol, Optional, Iterable, List, Type, TYPE_CHECKING
+    Mapping, Dict, Any, Union, TypeVar, Protocol, Optional, Iterable, List, Type, Tuple,
+    TYPE_CHECKING
 )
 
-from xinject import Dependency, XContext
+from xinject import Dependency, XContext, CurrentDependencyProxy
 from xloop import xloop
 from xsentinels import Default
 
@@ -24,6 +26,13 @@ T = TypeVar("T")
 
 RetrieverOrList = 'Union[SettingsRetrieverProtocol, Iterable[SettingsRetrieverProtocol]]'
 
+_object_getattribute = object.__getattribute__
+"""
+Used when reading our own internal attributes (ie: `__dict__`, `_instance_retrievers`)
+off a `BaseSettings` instance while resolving a field; going through
+`BaseSettings.__getattribute__` would mean another python-level call each time.
+"""
+
 
 class _SettingsMeta(type):
     """Represents the class-type instance/obj of the `BaseSettings` class.
@@ -35,9 +44,28 @@ class _SettingsMeta(type):
     """
 
     # This will be a class-attributes on the normal `BaseSettings` class/subclasses.
-    _setting_fields: Dict[str, SettingsField]
+    _setting_fields: Mapping[str, SettingsField]
+    """
+    Fields defined directly on self/cls; read-only, as `_all_setting_fields` is built from it
+    when the class is created (and would not see any later changes).
+    """
+
+    _all_setting_fields: Dict[str, SettingsField]
+    """
+    Fields defined on self/cls plus the ones inherited from BaseSettings superclasses in __mro__
+    (when several define the same field, the first one in __mro__ wins).
+    Lets us find any field with a single lookup, instead of checking each class in __mro__.
+    """
+
     _default_retrievers: 'List[SettingsRetrieverProtocol]'
 
+    _field_forward_refs: Dict[str, SettingsClassProperty]
+    """
+    `SettingsClassProperty` forward-references returned by `_SettingsMeta.__getattr__`
+    for self/cls fields, keyed by attribute name; they don't depend on anything else,
+    so they are only made once.
+    """
+
     _there_is_plain_superclass: bool
     """ There is some other superclass, other then BaseSettings/object/Dependency. """
 
@@ -82,11 +110,13 @@ class _SettingsMeta(type):
         attrs['_there_is_plain_superclass'] = False
         attrs['_setting_subclasses_in_mro'] = []
         attrs['_default_retrievers'] = list(xloop(default_retrievers))
+        attrs['_field_forward_refs'] = {}
 
         if skip_field_generation:
             # Skip doing anything special with any BaseSettings classes created in our/this module;
             # They are abstract classes and are need to be sub-classed to do anything with them.
-            attrs['_setting_fields'] = {}
+            attrs['_setting_fields'] = MappingProxyType({})
+            attrs['_all_setting_fields'] = {}
             cls = super().__new__(mcls, name, bases, attrs, **kwargs)  # noqa
             return cls
 
@@ -126,7 +156,8 @@ class _SettingsMeta(type):
             attrs, parent_fields
         )
 
-        attrs["_setting_fields"] = setting_fields
+        attrs["_setting_fields"] = MappingProxyType(setting_fields)
+        attrs["_all_setting_fields"] = {**parent_fields, **setting_fields}
 
         # Any attributes that were converted to fields we remove from class attributes,
         # they instead will be dynamically looked up lazily as-needed via their associated field.
@@ -227,22 +258,18 @@ class _SettingsMeta(type):
                 f"attribute name ({key}) on BaseSettings subclass ({self})."
             )
 
-        for c in self._setting_subclasses_in_mro:
-            c: _SettingsMeta
-            if key in c._setting_fields:
-                break
-            # We got to `BaseSettings` without finding anything, BaseSettings has no fields,
-            # raise exception about how we could not find field.
-            if c is BaseSettings:
-                raise AttributeError(
-                    f"Have no class-attribute or defined SettingsField for "
-                    f"attribute name ({key}) on BaseSettings subclass ({self})."
-                )
+        # Forward-references to fields are made once per class, and then reused.
+        if lazy_retriever := self._field_forward_refs.get(key):
+            return lazy_retriever
 
         @SettingsClassProperty
         def lazy_retriever(calling_cls):
             return getattr(self.grab(), key)
 
+        # Non-field names still get a new (uncached) forward-ref each time, same as before;
+        # only field forward-refs are reused.
+        if key in self._all_setting_fields:
+            self._field_forward_refs[key] = lazy_retriever
         return lazy_retriever
 
     def __setattr__(self, key: str, value: Union[SettingsField, Any]):
@@ -256,16 +283,7 @@ class _SettingsMeta(type):
         if key.startswith("_"):
             return super().__setattr__(key, value)
 
-        field = None
-        for c in self._setting_subclasses_in_mro:
-            c: _SettingsMeta
-            if field := c._setting_fields.get(key):
-                break
-            # We got to `BaseSettings` without finding anything, BaseSettings has no fields,
-            # give-up searching for field.
-            if c is BaseSettings:
-                break
-
+        field = self._all_setting_fields.get(key)
         if not field:
             # Right now we don't support making new SettingField's after the BaseSettings subclass
             # has been created. We could decide to do that in the future, but for now we
@@ -279,6 +297,35 @@ class _SettingsMeta(type):
         field.default_value = value
 
 
+class _SettingsProxy(CurrentDependencyProxy):
+    """
+    What `BaseSettings.proxy` returns. Acts exactly like `xinject.proxy.CurrentDependencyProxy`,
+    but reading/writing a public attribute grabs the current settings object directly.
+
+    The base-class goes through `_get_active` and its own `__getattribute__` several times
+    for each attribute read (to get `_get_active`, `_dependency_type` and `_grabber`);
+    settings proxies never have a grabber, so we skip all of that.
+
+    Relies on `xinject.proxy.CurrentDependencyProxy.__init__` storing the settings class in
+    `self._dependency_type`; `tests/test_settings.py::test_settings_proxy_dependency_type`
+    checks that, so a change on the xinject side fails loudly.
+    """
+
+    def __getattribute__(self, name):
+        # Anything that starts with a `_` is something that we want to get/set on self,
+        # and not on the current settings object.
+        if name.startswith('_'):
+            return object.__getattribute__(self, name)
+
+        return getattr(object.__getattribute__(self, '_dependency_type').grab(), name)
+
+    def __setattr__(self, key, value):
+        if key.startswith('_'):
+            return object.__setattr__(self, key, value)
+
+        return setattr(object.__getattribute__(self, '_dependency_type').grab(), key, value)
+
+
 class BaseSettings(
     Dependency,
     metaclass=_SettingsMeta,
@@ -419,6 +466,20 @@ class BaseSettings(
         for k, v in kwargs.items():
             setattr(self, k, v)
 
+    @classmethod
+    def proxy(cls: Type[T]) -> T:
+        """
+        Returns a proxy-object, that when an attribute is asked for, it will
+        proxy it to the current settings object of `cls`
+        (see `xinject.dependency.Dependency.proxy`).
+
+        ie: the equivalent of this code will run:
+        >>> # `requested_attribute` is the original attribute being requested
+        >>> # on returned proxy object.
+        >>> return getattr(cls.grab(), requested_attribute)
+        """
+        return _SettingsProxy.wrap(cls)
+
     def add_instance_retrievers(
             self, retrievers: 'Union[List[SettingsRetrieverProtocol], SettingsRetrieverProtocol]'
     ):
@@ -491,35 +552,12 @@ class BaseSettings(
         value = None
         already_retrieved_normal_value = False
         cls = type(self)
-        field: Optional[SettingsField] = None
-
-        for c in cls._setting_subclasses_in_mro:
-            c: _SettingsMeta
-            # todo: use isinstance?
-            if c is BaseSettings:
-                # We got to the 'BaseSettings' base-class it's self, no need to go any further.
-                break
-            if field := c._setting_fields.get(key):
-                # Found the field, break out of loop.
-                break
+        field: Optional[SettingsField] = cls._all_setting_fields.get(key)
 
-        def get_normal_value(obj: BaseSettings = self):
-            nonlocal value
-            nonlocal attr_error
-
-            # Keep track that we already attempted to get normal value.
-            nonlocal already_retrieved_normal_value
-            if obj is self:
-                already_retrieved_normal_value = True
-
-            try:
-                # Look for an attribute on self first.
-                value = object.__getattribute__(obj, key)
-                if hasattr(value, "__get__"):
-                    value = value.__get__(obj, cls)
-                attr_error = None
-            except AttributeError as error:
-                attr_error = error
+        # If we walk the entire dependency-chain below without finding a value, the parent
+        # instances we walked are shared with `_resolve_field_value` (it needs them for their
+        # retrievers), so the chain is only walked once per attribute read.
+        dependency_chain: Optional[List[BaseSettings]] = None
 
         # We don't want to grab the value like normal if we are a field
         # and DON'T have a locally/instance value defined for attribute.
@@ -529,20 +567,39 @@ class BaseSettings(
         #
         # Otherwise, the plain-class attribute would ALWAYS be used over the field,
         # making the subclasses field definition somewhat useless.
-        if not self._there_is_plain_superclass or not field or key in self.__dict__:
-            get_normal_value()
+        if (
+            not cls._there_is_plain_superclass
+            or not field
+            or key in _object_getattribute(self, '__dict__')
+        ):
+            # Keep track that we already attempted to get normal value.
+            already_retrieved_normal_value = True
+            value, attr_error = _get_normal_value(self, cls, key, value)
 
         if not already_retrieved_normal_value or value is None:
             # See if any parent-setting-instances (not super/base classes)
+            walked_chain = []
             for parent_settings in XContext.grab().dependency_chain(cls):
-                if key in parent_settings.__dict__:
-                    get_normal_value(parent_settings)
+                walked_chain.append(parent_settings)
+                if key in _object_getattribute(parent_settings, '__dict__'):
+                    if parent_settings is self:
+                        already_retrieved_normal_value = True
+                    value, attr_error = _get_normal_value(parent_settings, cls, key, value)
 
                 if value is not None:
                     break
+            else:
+                # No value found, so `_resolve_field_value` will need the full chain.
+                dependency_chain = walked_chain
         try:
             if field:
-                return _resolve_field_value(settings=self, field=field, key=key, value=value)
+                return _resolve_field_value(
+                    settings=self,
+                    field=field,
+                    key=key,
+                    value=value,
+                    dependency_chain=dependency_chain,
+                )
         except SettingsValueError as e:
             # todo: Do some sort of refactoring/splitting this out of this method
             #       (starting to get too large).
@@ -555,7 +612,7 @@ class BaseSettings(
                 # Just continue the original exception
                 raise
 
-            get_normal_value()
+            value, attr_error = _get_normal_value(self, cls, key, value)
             if attr_error:
                 # Could not get the normal value from superclass, raise original exception.
                 # todo: for Python 3.11, we can raise both exceptions (e + attr_error)
@@ -606,28 +663,79 @@ Here for backwards compatability, renamed original class from `Settings` to `Bas
 """
 
 
-def _resolve_field_value(settings: BaseSettings, field: SettingsField, key: str, value: Any):
+def _get_normal_value(
+        obj: BaseSettings, cls: 'Type[BaseSettings]', key: str, value: Any
+) -> Tuple[Any, Optional[AttributeError]]:
+    """
+    Gets attribute `key` from `obj` like normal python would (a value set on obj, or a
+    class/superclass attribute, calling `__get__` on it with `obj` and `cls` if it has one).
+
+    Module-level function, instead of a closure in `BaseSettings.__getattribute__`,
+    so one does not need to be allocated each time any settings attribute is read.
+
+    Returns: `(value, attr_error)`; if the attribute can't be retrieved, `attr_error` is the
+        `AttributeError` and `value` is whatever was passed in (if the attribute was found but
+        its `__get__` raised the error, `value` will be the attribute it's self).
+    """
+    try:
+        value = object.__getattribute__(obj, key)
+        if hasattr(value, "__get__"):
+            value = value.__get__(obj, cls)
+    except AttributeError as error:
+        return value, error
+    return value, None
+
+
+def _field_retrievers(
+        settings: BaseSettings, field: SettingsField, dependency_chain: 'Iterable[BaseSettings]'
+) -> 'Iterable[SettingsRetrieverProtocol]':
+    """
+    Yields the retrievers to try for `field`, in order: the field's own retriever, then
+    instance-retrievers of `settings` and of its parent instances in `dependency_chain`,
+    then the default-retrievers of each BaseSettings class in `settings` __mro__.
+
+    `None` is never yielded. This runs for every attribute read that needs a retriever, so it
+    walks the retriever lists directly instead of using `xloop`
+    (which inspects each argument to see if it should be iterated, via a try/except).
+    """
+    if (retriever := field.retriever) is not None:
+        yield retriever
+
+    for r in _object_getattribute(settings, '_instance_retrievers'):
+        if r is not None:
+            yield r
+
+    for parent_settings in dependency_chain:
+        # skip self if we are in chain, already did it.
+        if parent_settings is settings:
+            continue
+        for r in _object_getattribute(parent_settings, '_instance_retrievers'):
+            if r is not None:
+                yield r
+
+    for parent_class in type(settings)._setting_subclasses_in_mro:
+        for r in parent_class._default_retrievers:
+            if r is not None:
+                yield r
+
+
+def _resolve_field_value(
+        settings: BaseSettings,
+        field: SettingsField,
+        key: str,
+        value: Any,
+        dependency_chain: 'Optional[Iterable[BaseSettings]]' = None
+):
     cls = type(settings)
 
     # If we have a field, and current value is Default, or we got AttributeError,
     # we attempt to retrieve the value via the field's retriever.
     if value is None or value is Default:
-        def self_and_parent_retrievers():
-            for r in settings._instance_retrievers:
-                yield r
-
-            for parent_settings in XContext.grab().dependency_chain(cls):
-                # skip self if we are in chain, already did it.
-                if parent_settings is settings:
-                    continue
-                for r in parent_settings._instance_retrievers:
-                    yield r
-
-            for parent_class in cls._setting_subclasses_in_mro:
-                for r in parent_class._default_retrievers:
-                    yield r
+        if dependency_chain is None:
+            # Caller did not need to look up the dependency-chain, so do that now.
+            dependency_chain = XContext.grab().dependency_chain(cls)
 
-        for retriever in xloop(field.retriever, self_and_parent_retrievers()):
+        for retriever in _field_retrievers(settings, field, dependency_chain):
             value = retriever(field=field, settings=settings)
 
             if value is Default: